@@ -0,0 +1,262 @@
+"""
+LifeBetter Meta-Learning System
+Streaming bridge from English learning error logs into MetaLearner experiences
+
+Each error entry becomes an experience whose task_type is the error
+category and whose score decays with how often that category recurred.
+The approach is whether the correction came with an explanation, so the
+learner can compare explained and bare corrections per category.
+"""
+
+import json
+import os
+
+
+EXPLAINED_APPROACH = "explained_correction"
+BARE_APPROACH = "bare_correction"
+
+
+def load_checkpoint(checkpoint_path):
+    """
+    Load the persisted streaming cursor
+
+    Args:
+        checkpoint_path (str): Path to the checkpoint file
+
+    Returns:
+        dict: Checkpoint with the entry offset, per-category seen counts,
+            the identity of the last processed entry and the learner state
+    """
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        checkpoint = {}
+
+    if not isinstance(checkpoint, dict):
+        checkpoint = {}
+
+    return {
+        "offset": checkpoint.get("offset", 0),
+        "category_counts": checkpoint.get("category_counts", {}),
+        "learning_start_date": checkpoint.get("learning_start_date"),
+        "last_entry": checkpoint.get("last_entry"),
+        "learner": checkpoint.get("learner")
+    }
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    """
+    Persist the streaming cursor atomically
+
+    Args:
+        checkpoint_path (str): Path to the checkpoint file
+        checkpoint (dict): Checkpoint data to store
+    """
+    directory = os.path.dirname(checkpoint_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def is_valid_entry(entry):
+    """
+    Check whether an error log entry can be converted
+
+    Args:
+        entry: Raw item from the log's error_entries list
+
+    Returns:
+        bool: True if the entry is a dict with a string category
+    """
+    return isinstance(entry, dict) and isinstance(entry.get("category", "general"), str)
+
+
+def entry_marker(entry):
+    """
+    Build an identity marker for an error log entry
+
+    Args:
+        entry: Raw item from the log's error_entries list
+
+    Returns:
+        dict: Fields identifying the entry across runs, or None if malformed
+    """
+    if not isinstance(entry, dict):
+        return None
+
+    return {
+        "timestamp": entry.get("timestamp"),
+        "category": entry.get("category"),
+        "original_text": entry.get("original_text")
+    }
+
+
+def entry_to_experience(entry, prior_occurrences):
+    """
+    Convert an error log entry into a MetaLearner experience
+
+    The score decays with how often the category has already been seen,
+    so recurring mistakes pull the category's average down.
+
+    Args:
+        entry (dict): Error entry from the English learning log
+        prior_occurrences (int): Times this category was seen before the entry
+
+    Returns:
+        dict: Experience data for MetaLearner.learn_from_experience
+    """
+    approach = EXPLAINED_APPROACH if entry.get("explanation") else BARE_APPROACH
+
+    return {
+        "task_type": entry.get("category", "general"),
+        "input": {"original_text": entry.get("original_text", "")},
+        "output": {"corrected_text": entry.get("corrected_text", "")},
+        "strategy": {"approach": approach},
+        "outcome": {
+            "score": 1.0 / (1 + prior_occurrences),
+            "recurrence": prior_occurrences
+        },
+        "timestamp": entry.get("timestamp")
+    }
+
+
+class ErrorLogStream:
+    """
+    Incrementally tails an English learning error log and feeds new
+    entries to a MetaLearner in checkpointed batches.
+
+    The checkpoint holds the learner's state alongside the cursor, so a
+    learner passed to feed is restored from it before any new entries
+    are applied.
+    """
+
+    def __init__(self, log_path, checkpoint_path, batch_size=50):
+        """
+        Initialize the stream
+
+        Args:
+            log_path (str): Path to the error_log.json file
+            checkpoint_path (str): Path where the cursor is persisted
+            batch_size (int): Number of entries fed per batch
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.log_path = log_path
+        self.checkpoint_path = checkpoint_path
+        self.batch_size = batch_size
+
+    def _load_log(self):
+        """
+        Load the error log
+
+        Returns:
+            dict: Log data, empty if the log does not exist yet, or None if
+                it could not be read (e.g. it is being rewritten)
+        """
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                log_data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(log_data, dict):
+            return None
+        if not isinstance(log_data.get("error_entries", []), list):
+            return None
+        return log_data
+
+    def _iter_batches(self, entries, offset, counts, start_date):
+        """
+        Yield batches of experiences starting at the given offset
+
+        Malformed entries are skipped but still advance the cursor.
+
+        Args:
+            entries (list): Error entries from the log
+            offset (int): Index of the first unprocessed entry
+            counts (dict): Per-category seen counts before the offset
+            start_date (str): The log's learning_start_date
+
+        Yields:
+            tuple: (list of experiences, cursor dict to persist afterwards)
+        """
+        counts = dict(counts)
+        while offset < len(entries):
+            batch = []
+            chunk = entries[offset:offset + self.batch_size]
+            for entry in chunk:
+                if not is_valid_entry(entry):
+                    continue
+                category = entry.get("category", "general")
+                batch.append(entry_to_experience(entry, counts.get(category, 0)))
+                counts[category] = counts.get(category, 0) + 1
+            offset += len(chunk)
+            yield batch, {
+                "offset": offset,
+                "category_counts": dict(counts),
+                "learning_start_date": start_date,
+                "last_entry": entry_marker(entries[offset - 1])
+            }
+
+    def feed(self, learner):
+        """
+        Feed unprocessed entries to the learner, checkpointing after each batch
+
+        The learner is first restored from the checkpoint, or cleared if the
+        log was reset or replaced. If feeding fails, the learner is rolled
+        back to the last checkpointed state before the error is re-raised.
+
+        Args:
+            learner (MetaLearner): Learner receiving the experiences
+
+        Returns:
+            int: Number of experiences fed during this run
+        """
+        log_data = self._load_log()
+        if log_data is None:
+            # Unreadable log; try again on the next run without resetting
+            return 0
+
+        entries = log_data.get("error_entries", [])
+        start_date = log_data.get("learning_start_date")
+        checkpoint = load_checkpoint(self.checkpoint_path)
+        offset = checkpoint["offset"]
+        counts = checkpoint["category_counts"]
+        learner_state = checkpoint["learner"]
+
+        # The log was reset or replaced; start over from the beginning
+        if offset > 0 and (
+            offset > len(entries)
+            or checkpoint["learning_start_date"] != start_date
+            or checkpoint["last_entry"] != entry_marker(entries[offset - 1])
+        ):
+            offset = 0
+            counts = {}
+            learner_state = {"experience_memory": [], "meta_knowledge": {}}
+
+        if learner_state is not None:
+            learner.load_state(learner_state)
+        committed = learner.get_state()
+
+        processed = 0
+        try:
+            for batch, cursor in self._iter_batches(entries, offset, counts, start_date):
+                for experience in batch:
+                    learner.learn_from_experience(experience)
+                state = learner.get_state()
+                cursor["learner"] = state
+                save_checkpoint(self.checkpoint_path, cursor)
+                committed = state
+                processed += len(batch)
+        except Exception:
+            learner.load_state(committed)
+            raise
+        return processed
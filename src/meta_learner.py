@@ -3,6 +3,9 @@ LifeBetter Meta-Learning System
 Main meta-learning implementation
 """
 
+import copy
+
+
 class MetaLearner:
     """
     A meta-learning system that learns how to learn better over time.
@@ -121,6 +124,29 @@ class MetaLearner:
             "meta_knowledge_size": len(self.meta_knowledge)
         }
 
+    def get_state(self):
+        """
+        Get a snapshot of the learned state
+
+        Returns:
+            dict: Copy of the experience memory and meta-knowledge
+        """
+        return copy.deepcopy({
+            "experience_memory": self.experience_memory,
+            "meta_knowledge": self.meta_knowledge
+        })
+
+    def load_state(self, state):
+        """
+        Restore the learned state from a snapshot
+
+        Args:
+            state (dict): Snapshot as returned by get_state
+        """
+        state = copy.deepcopy(state)
+        self.experience_memory = state.get("experience_memory", [])[-self.memory_size:]
+        self.meta_knowledge = state.get("meta_knowledge", {})
+
 
 def create_meta_learner(config=None):
     """
@@ -0,0 +1,232 @@
+"""
+Tests for the English error log to MetaLearner bridge
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from src.error_log_bridge import ErrorLogStream, load_checkpoint
+from src.meta_learner import MetaLearner
+
+
+class FailingLearner(MetaLearner):
+    """MetaLearner that raises on the n-th experience"""
+
+    def __init__(self, fail_on):
+        super().__init__(memory_size=100, learning_rate=0.01)
+        self.fail_on = fail_on
+        self.calls = 0
+
+    def learn_from_experience(self, experience):
+        self.calls += 1
+        if self.fail_on is not None and self.calls == self.fail_on:
+            raise RuntimeError("learner failure")
+        super().learn_from_experience(experience)
+
+
+class TestErrorLogStream(unittest.TestCase):
+    """Test cases for the ErrorLogStream class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.tmp_dir, "error_log.json")
+        self.checkpoint_path = os.path.join(self.tmp_dir, "bridge_checkpoint.json")
+        self.entries = []
+        self.learner = MetaLearner(memory_size=100, learning_rate=0.01)
+        self.stream = ErrorLogStream(self.log_path, self.checkpoint_path, batch_size=2)
+
+    def tearDown(self):
+        """Remove temporary files"""
+        shutil.rmtree(self.tmp_dir)
+
+    def _add_errors(self, *categories, explanation="example"):
+        """Append entries to the on-disk error log"""
+        for category in categories:
+            self.entries.append({
+                "timestamp": "2026-01-01T00:00:00",
+                "original_text": "I has a apple",
+                "corrected_text": "I have an apple",
+                "category": category,
+                "explanation": explanation
+            })
+        self._write_log({"error_entries": self.entries})
+
+    def _write_log(self, log_data):
+        """Overwrite the on-disk error log"""
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            json.dump(log_data, f)
+
+    def test_missing_log(self):
+        """Test that a missing log feeds nothing"""
+        self.assertEqual(self.stream.feed(self.learner), 0)
+        self.assertEqual(len(self.learner.experience_memory), 0)
+
+    def test_feed_converts_entries(self):
+        """Test that entries become experiences keyed by category"""
+        self._add_errors("grammar", "article", "grammar")
+
+        self.assertEqual(self.stream.feed(self.learner), 3)
+
+        self.assertEqual(len(self.learner.experience_memory), 3)
+        self.assertIn("grammar", self.learner.meta_knowledge)
+        self.assertIn("article", self.learner.meta_knowledge)
+
+    def test_recurrence_lowers_score(self):
+        """Test that repeated errors in a category score lower"""
+        self._add_errors("grammar", "grammar", "grammar")
+        self.stream.feed(self.learner)
+
+        scores = [exp["outcome"]["score"] for exp in self.learner.experience_memory]
+        self.assertEqual(scores, [1.0, 0.5, 1.0 / 3])
+
+    def test_rerun_processes_only_delta(self):
+        """Test that re-running only ingests new entries"""
+        self._add_errors("grammar", "article", "spelling")
+        self.assertEqual(self.stream.feed(self.learner), 3)
+        self.assertEqual(self.stream.feed(self.learner), 0)
+
+        self._add_errors("grammar")
+        self.assertEqual(self.stream.feed(self.learner), 1)
+
+        self.assertEqual(len(self.learner.experience_memory), 4)
+        # Recurrence carries over through the checkpoint
+        self.assertEqual(self.learner.experience_memory[-1]["outcome"]["recurrence"], 1)
+        self.assertEqual(load_checkpoint(self.checkpoint_path)["offset"], 4)
+
+    def test_rerun_in_new_process_matches_full_run(self):
+        """Test that a resumed learner ends up like one fed the whole log"""
+        self._add_errors("grammar", "article", "grammar")
+        self.stream.feed(self.learner)
+        self._add_errors("grammar", "article")
+
+        learner = MetaLearner(memory_size=100, learning_rate=0.01)
+        stream = ErrorLogStream(self.log_path, self.checkpoint_path, batch_size=2)
+        self.assertEqual(stream.feed(learner), 2)
+
+        full_learner = MetaLearner(memory_size=100, learning_rate=0.01)
+        full_stream = ErrorLogStream(
+            self.log_path, os.path.join(self.tmp_dir, "full.json"), batch_size=2
+        )
+        full_stream.feed(full_learner)
+
+        self.assertEqual(len(learner.experience_memory), 5)
+        self.assertEqual(learner.meta_knowledge, full_learner.meta_knowledge)
+        stats = learner.meta_knowledge["grammar"]["explained_correction"]
+        self.assertEqual(stats["count"], 3)
+        self.assertAlmostEqual(stats["avg_score"], (1.0 + 0.5 + 1.0 / 3) / 3)
+
+    def test_checkpoint_saved_per_batch(self):
+        """Test that a failure mid-batch rolls back to the last checkpoint"""
+        self._add_errors("grammar", "article", "spelling", "tense")
+        learner = FailingLearner(fail_on=4)
+
+        with self.assertRaises(RuntimeError):
+            self.stream.feed(learner)
+
+        # Only the first full batch was committed before the failure
+        self.assertEqual(load_checkpoint(self.checkpoint_path)["offset"], 2)
+        self.assertEqual(len(learner.experience_memory), 2)
+
+        learner.fail_on = None
+        self.assertEqual(self.stream.feed(learner), 2)
+        self.assertEqual(len(learner.experience_memory), 4)
+        self.assertEqual(learner.meta_knowledge["spelling"]["explained_correction"]["count"], 1)
+        self.assertEqual(load_checkpoint(self.checkpoint_path)["offset"], 4)
+
+    def test_log_reset_restarts_from_beginning(self):
+        """Test that a shrunken log is re-read from the start"""
+        self._add_errors("grammar", "article", "spelling")
+        self.stream.feed(self.learner)
+
+        self.entries = []
+        self._add_errors("tense")
+        self.assertEqual(self.stream.feed(self.learner), 1)
+        self.assertEqual(load_checkpoint(self.checkpoint_path)["offset"], 1)
+        self.assertEqual(list(self.learner.meta_knowledge), ["tense"])
+
+    def test_replaced_log_restarts_from_beginning(self):
+        """Test that a replaced log at least as long as the offset is re-read"""
+        self._add_errors("a", "a", "a")
+        self.stream.feed(self.learner)
+
+        self.entries = []
+        self._add_errors("b", "b", "b", "b")
+        self.assertEqual(self.stream.feed(self.learner), 4)
+
+        checkpoint = load_checkpoint(self.checkpoint_path)
+        self.assertEqual(checkpoint["offset"], 4)
+        self.assertEqual(checkpoint["category_counts"], {"b": 4})
+        self.assertEqual(list(self.learner.meta_knowledge), ["b"])
+        self.assertEqual(len(self.learner.experience_memory), 4)
+
+    def test_new_learning_start_date_restarts(self):
+        """Test that a log with a new start date replaces the learner state"""
+        self._add_errors("grammar", "article")
+        self.stream.feed(self.learner)
+
+        self._write_log({"learning_start_date": "2026-02-01",
+                         "error_entries": self.entries})
+        self.assertEqual(self.stream.feed(self.learner), 2)
+
+        self.assertEqual(len(self.learner.experience_memory), 2)
+        for category in ("grammar", "article"):
+            stats = self.learner.meta_knowledge[category]["explained_correction"]
+            self.assertEqual(stats["count"], 1)
+            self.assertEqual(stats["avg_score"], 1.0)
+
+    def test_truncated_log_is_skipped(self):
+        """Test that a partially written log leaves the checkpoint untouched"""
+        self._add_errors("grammar", "article")
+        self.stream.feed(self.learner)
+        checkpoint = load_checkpoint(self.checkpoint_path)
+
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            f.write('{"error_entries": [{"category": "gram')
+        self.assertEqual(self.stream.feed(self.learner), 0)
+        self.assertEqual(load_checkpoint(self.checkpoint_path), checkpoint)
+
+        self._add_errors("spelling")
+        self.assertEqual(self.stream.feed(self.learner), 1)
+
+    def test_non_object_log_is_skipped(self):
+        """Test that a log with the wrong shape leaves the checkpoint untouched"""
+        self._add_errors("grammar")
+        self.stream.feed(self.learner)
+        checkpoint = load_checkpoint(self.checkpoint_path)
+
+        for log_data in ([], {"error_entries": {"category": "grammar"}}):
+            self._write_log(log_data)
+            self.assertEqual(self.stream.feed(self.learner), 0)
+            self.assertEqual(load_checkpoint(self.checkpoint_path), checkpoint)
+
+    def test_malformed_entries_are_skipped(self):
+        """Test that malformed entries are skipped without stopping the stream"""
+        self._add_errors("grammar")
+        self.entries.extend(["not an entry", {"category": ["grammar"]}])
+        self._add_errors("article")
+
+        self.assertEqual(self.stream.feed(self.learner), 2)
+        self.assertEqual(load_checkpoint(self.checkpoint_path)["offset"], 4)
+        self.assertEqual(set(self.learner.meta_knowledge), {"grammar", "article"})
+
+    def test_approach_follows_explanation(self):
+        """Test that explained and bare corrections are separate approaches"""
+        self._add_errors("grammar", "grammar")
+        self._add_errors("grammar", explanation="")
+        self.stream.feed(self.learner)
+
+        approaches = self.learner.meta_knowledge["grammar"]
+        self.assertEqual(approaches["explained_correction"]["count"], 2)
+        self.assertEqual(approaches["bare_correction"]["count"], 1)
+
+    def test_invalid_batch_size(self):
+        """Test that a non-positive batch size is rejected"""
+        with self.assertRaises(ValueError):
+            ErrorLogStream(self.log_path, self.checkpoint_path, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
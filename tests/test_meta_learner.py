@@ -90,6 +90,24 @@ class TestMetaLearner(unittest.TestCase):
         self.assertIn("memory_usage", insights)
         self.assertIn("meta_knowledge_size", insights)
 
+    def test_state_round_trip(self):
+        """Test saving and restoring learned state"""
+        self.learner.learn_from_experience({
+            "task_type": "optimization",
+            "strategy": {"approach": "gradient_descent"},
+            "outcome": {"score": 0.95}
+        })
+        state = self.learner.get_state()
+
+        restored = MetaLearner(memory_size=10, learning_rate=0.01)
+        restored.load_state(state)
+
+        self.assertEqual(restored.experience_memory, self.learner.experience_memory)
+        self.assertEqual(restored.meta_knowledge, self.learner.meta_knowledge)
+        # The snapshot is a copy, not shared with the learner
+        state["meta_knowledge"].clear()
+        self.assertIn("optimization", restored.meta_knowledge)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file